@@ -17,26 +17,40 @@ This script consolidates all coursework from Week 2 to Week 8:
 
 import sqlite3
 import json
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from collections import defaultdict
-import csv
 import os
+import sys
+
+# Numba is optional: small portfolios run the plain NumPy path anyway
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = prange = None
+
+# ijson is optional: without it the history JSON is loaded in one piece
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # === Utility Functions ===
+# Grab "now" once per run; datetime.today() is a syscall and every
+# holding would otherwise make its own
+_TODAY = datetime.today()
+
 def calculate_earnings(current_price, purchase_price, shares):
     return (current_price - purchase_price) * shares
 
 def calculate_percentage_yield(current_price, purchase_price):
     return ((current_price - purchase_price) / purchase_price) * 100
 
-def calculate_yearly_return(current_price, purchase_price, purchase_date_str):
-    purchase_date = datetime.strptime(purchase_date_str, "%m/%d/%Y")
-    today = datetime.today()
-    years_held = (today - purchase_date).days / 365.25
+def calculate_yearly_return(current_price, purchase_price, purchase_date):
+    """Annualized return; purchase_date is an already-parsed datetime."""
+    years_held = (_TODAY - purchase_date).days / 365.25
     if years_held <= 0:
         return 0.0
     total_return = (current_price - purchase_price) / purchase_price
@@ -51,6 +65,11 @@ class Investor:
         self.phone = phone
 
 class Investment:
+    # No per-instance __dict__: cuts the memory footprint of large holdings
+    __slots__ = ('purchase_id', 'symbol', 'quantity', 'purchase_price',
+                 'current_price', 'purchase_date',
+                 '_pd', '_years_held', '_earnings', '_pct_yield', '_yearly')
+
     def __init__(self, purchase_id, symbol, quantity, purchase_price, current_price, purchase_date):
         self.purchase_id = purchase_id
         self.symbol = symbol
@@ -58,57 +77,159 @@ class Investment:
         self.purchase_price = float(purchase_price)
         self.current_price = float(current_price)
         self.purchase_date = purchase_date
+        # Compute each metric once; the filter menu re-reads them many times
+        self._pd = datetime.strptime(purchase_date, "%m/%d/%Y")
+        self._years_held = (_TODAY - self._pd).days / 365.25
+        self._earnings = calculate_earnings(self.current_price, self.purchase_price, self.quantity)
+        self._pct_yield = calculate_percentage_yield(self.current_price, self.purchase_price)
+        self._yearly = calculate_yearly_return(self.current_price, self.purchase_price, self._pd)
+
+    def earnings(self):
+        return self._earnings
+
+    def percent_yield(self):
+        return self._pct_yield
+
+    def yearly_return(self):
+        return self._yearly
+
+# Only dispatch to the JIT-compiled kernel when the portfolio is big
+# enough for the compile/dispatch cost to pay off
+_NUMBA_MIN_ROWS = 100_000
+
+if njit is not None:
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _metrics(cp, pp, qty, days_held):
+        n = cp.shape[0]
+        earnings = np.empty(n)
+        pct_yield = np.empty(n)
+        yearly = np.empty(n)
+        for i in prange(n):
+            diff = cp[i] - pp[i]
+            earnings[i] = diff * qty[i]
+            pct_yield[i] = diff / pp[i] * 100.0
+            years = days_held[i] / 365.25
+            yearly[i] = diff / pp[i] / years * 100.0 if years > 0 else 0.0
+        return earnings, pct_yield, yearly
+else:
+    _metrics = None
+
+# Column layouts for the stock and bond data files (no header rows)
+STOCK_COLUMNS = ['symbol', 'quantity', 'purchase_price', 'current_price', 'purchase_date']
+BOND_COLUMNS = ['symbol', 'quantity', 'purchase_price', 'current_price',
+                'coupon', 'yield_rate', 'purchase_date']
+
+@dataclass
+class Portfolio:
+    """Column-oriented (structure-of-arrays) view of the stock holdings.
+
+    Keeping each field as one contiguous NumPy array lets every metric be
+    computed as a single vectorized expression instead of a method call
+    per Investment object.
+    """
+    symbols: np.ndarray
+    qty: np.ndarray
+    pp: np.ndarray          # purchase price
+    cp: np.ndarray          # current price
+    pdates: np.ndarray      # purchase dates packed as datetime64[D]
+
+    @classmethod
+    def from_csv(cls, filename):
+        df = pd.read_csv(filename, header=None, names=STOCK_COLUMNS)
+        pdates = pd.to_datetime(df['purchase_date'], format='%m/%d/%Y').values.astype('datetime64[D]')
+        return cls(
+            symbols=df['symbol'].to_numpy(),
+            qty=df['quantity'].to_numpy(np.int64),
+            pp=df['purchase_price'].to_numpy(np.float64),
+            cp=df['current_price'].to_numpy(np.float64),
+            pdates=pdates,
+        )
+
+    @classmethod
+    def empty(cls):
+        return cls(np.empty(0, object), np.empty(0, np.int64),
+                   np.empty(0, np.float64), np.empty(0, np.float64),
+                   np.empty(0, 'datetime64[D]'))
+
+    def __len__(self):
+        return len(self.symbols)
 
     def earnings(self):
-        return calculate_earnings(self.current_price, self.purchase_price, self.quantity)
+        return (self.cp - self.pp) * self.qty
 
     def percent_yield(self):
-        return calculate_percentage_yield(self.current_price, self.purchase_price)
+        return (self.cp - self.pp) / self.pp * 100
+
+    def days_held(self):
+        # int32 day counts: half the bytes of float64 for the same math
+        return (np.datetime64('today', 'D') - self.pdates).astype(np.int32)
+
+    def years_held(self):
+        return self.days_held() / 365.25
 
     def yearly_return(self):
-        return calculate_yearly_return(self.current_price, self.purchase_price, self.purchase_date)
+        years = self.years_held()
+        total = (self.cp - self.pp) / self.pp
+        return np.where(years > 0, total / np.where(years > 0, years, 1) * 100, 0.0)
+
+    def metrics(self):
+        """Return (earnings, percent yield, yearly return) as three arrays.
+
+        Large portfolios go through the parallel Numba kernel when it is
+        available; otherwise the NumPy expressions above do the work.
+        """
+        if _metrics is not None and len(self) >= _NUMBA_MIN_ROWS:
+            return _metrics(self.cp, self.pp, self.qty, self.days_held())
+        return self.earnings(), self.percent_yield(), self.yearly_return()
+
+    def to_investments(self):
+        """Build Investment objects for the parts that still work row-wise."""
+        date_strs = pd.to_datetime(self.pdates).strftime('%m/%d/%Y')
+        return [Investment(f"S{i}", sym, qty, pp, cp, date)
+                for i, (sym, qty, pp, cp, date)
+                in enumerate(zip(self.symbols, self.qty, self.pp, self.cp, date_strs), start=1)]
 
 class Bond(Investment):
+    __slots__ = ('coupon', 'yield_rate')
+
     def __init__(self, purchase_id, symbol, quantity, purchase_price, current_price, coupon, yield_rate, purchase_date):
         super().__init__(purchase_id, symbol, quantity, purchase_price, current_price, purchase_date)
         self.coupon = float(coupon)
         self.yield_rate = float(yield_rate.strip('%')) / 100
-
-    def earnings(self):
-        return super().earnings() + (self.quantity * self.purchase_price * self.yield_rate)
+        # Fold the yield income into the cached earnings figure
+        self._earnings += self.quantity * self.purchase_price * self.yield_rate
 
 # === File I/O ===
 def read_stocks(filename):
-    investments = []
     try:
-        with open(filename, 'r') as f:
-            for idx, line in enumerate(f, start=1):
-                symbol, qty, p_price, c_price, p_date = line.strip().split(',')
-                investments.append(
-                    Investment(f"S{idx}", symbol, qty, p_price, c_price, p_date)
-                )
+        return Portfolio.from_csv(filename)
     except Exception as e:
         print(f"Error reading stock file '{filename}': {e}")
-    return investments
+        return Portfolio.empty()
 
 def read_bonds(filename):
-    bonds = []
     try:
-        with open(filename, 'r') as f:
-            for idx, line in enumerate(f, start=1):
-                parts = line.strip().split(',')
-                if len(parts) == 7:
-                    symbol, qty, p_price, c_price, coupon, yld, p_date = parts
-                    bonds.append(
-                        Bond(f"B{idx}", symbol, qty, p_price, c_price, coupon, yld, p_date)
-                    )
+        df = pd.read_csv(filename, header=None, names=BOND_COLUMNS,
+                         dtype=str, on_bad_lines='skip')
+        # Rows with fewer than 7 fields come back padded with NaN; drop them
+        df = df.dropna()
+        # Strip the % suffix for the whole column in one call
+        yld = df['yield_rate'].str.rstrip('%')
+        return [Bond(f"B{idx}", sym, qty, p_price, c_price, coupon, y, p_date)
+                for idx, (sym, qty, p_price, c_price, coupon, y, p_date)
+                in enumerate(zip(df['symbol'], df['quantity'], df['purchase_price'],
+                                 df['current_price'], df['coupon'], yld,
+                                 df['purchase_date']), start=1)]
     except Exception as e:
         print(f"Error reading bond file '{filename}': {e}")
-    return bonds
+        return []
 
 # === SQLite Database Integration ===
 def setup_database(db_path, stocks, bonds):
-    conn = sqlite3.connect(db_path)
+    # The database is a derived artifact, so stage everything in memory
+    # and copy it to disk in one bulk pass at the end; the inserts
+    # themselves never touch the disk
+    conn = sqlite3.connect(':memory:')
     cursor = conn.cursor()
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS stocks (
@@ -123,76 +244,131 @@ def setup_database(db_path, stocks, bonds):
             yield_rate REAL, purchase_date TEXT
         );
     """)
-    # Insert or replace
-    for inv in stocks:
-        cursor.execute("""
-            INSERT OR REPLACE INTO stocks
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (inv.purchase_id, inv.symbol, inv.quantity,
-              inv.purchase_price, inv.current_price, inv.purchase_date))
-    for bond in bonds:
-        cursor.execute("""
-            INSERT OR REPLACE INTO bonds
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (bond.purchase_id, bond.symbol, bond.quantity,
-              bond.purchase_price, bond.current_price, bond.coupon,
-              bond.yield_rate, bond.purchase_date))
+    # Batch all inserts into one transaction instead of a statement per row
+    stock_rows = [(inv.purchase_id, inv.symbol, inv.quantity,
+                   inv.purchase_price, inv.current_price, inv.purchase_date)
+                  for inv in stocks]
+    bond_rows = [(bond.purchase_id, bond.symbol, bond.quantity,
+                  bond.purchase_price, bond.current_price, bond.coupon,
+                  bond.yield_rate, bond.purchase_date)
+                 for bond in bonds]
+    conn.execute("BEGIN")
+    cursor.executemany("INSERT OR REPLACE INTO stocks VALUES (?, ?, ?, ?, ?, ?)", stock_rows)
+    cursor.executemany("INSERT OR REPLACE INTO bonds VALUES (?, ?, ?, ?, ?, ?, ?, ?)", bond_rows)
     conn.commit()
+    # backup() copies whole pages, which beats replaying inserts on disk
+    disk = sqlite3.connect(db_path)
+    disk.execute("PRAGMA journal_mode=WAL")
+    disk.execute("PRAGMA synchronous=NORMAL")
+    conn.backup(disk)
+    disk.close()
     return conn
 
+# Row layout for streaming SELECT results straight into NumPy
+_STOCK_ROW_DTYPE = np.dtype([('symbol', 'U10'), ('qty', 'i8'), ('pp', 'f8'),
+                             ('cp', 'f8'), ('pdate', 'U10')])
+
+def get_stocks(conn):
+    """Rebuild the stock Portfolio straight from the stocks table."""
+    conn.row_factory = None  # plain tuples are the cheapest row type
+    cursor = conn.execute(
+        "SELECT symbol, quantity, purchase_price, current_price, purchase_date FROM stocks"
+    )
+    # The cursor streams rows in arraysize batches; no fetchall list is built
+    rows = np.fromiter(cursor, dtype=_STOCK_ROW_DTYPE)
+    pdates = pd.to_datetime(rows['pdate'], format='%m/%d/%Y').values.astype('datetime64[D]')
+    return Portfolio(
+        symbols=rows['symbol'].astype(object),
+        qty=rows['qty'],
+        pp=rows['pp'],
+        cp=rows['cp'],
+        pdates=pdates,
+    )
+
 # === Reporting ===
-def write_report(investor, stocks, bonds, output_file):
+# Packed per-bond record: ~64 contiguous bytes instead of a ~400-byte
+# Python object, with float32 fields for the vectorized earnings math
+BOND_DTYPE = np.dtype([('pid', 'U6'), ('symbol', 'U10'), ('qty', 'i4'),
+                       ('pp', 'f4'), ('cp', 'f4'), ('coupon', 'f4'),
+                       ('yld', 'f4'), ('pdate', 'datetime64[D]')])
+
+def _bond_array(bonds):
+    """Pack Bond objects into one contiguous structured array."""
+    arr = np.empty(len(bonds), BOND_DTYPE)
+    for i, b in enumerate(bonds):
+        arr[i] = (b.purchase_id, b.symbol, b.quantity, b.purchase_price,
+                  b.current_price, b.coupon, b.yield_rate, b._pd.date())
+    return arr
+
+def write_report(investor, folio, bonds, output_file):
     try:
+        earnings, pct_yield, yearly = folio.metrics()
         with open(output_file, 'w') as f:
             f.write(f"Investor: {investor.name}\n")
             f.write(f"Address: {investor.address}\n")
             f.write(f"Phone: {investor.phone}\n\n")
             f.write("STOCKS:\n")
             f.write(f"{'ID':<6}{'Symbol':<10}{'Qty':<6}{'Earn':<10}{'Yield%':<10}{'Yearly%':<10}\n")
-            for s in stocks:
-                f.write(f"{s.purchase_id:<6}{s.symbol:<10}{s.quantity:<6}"
-                        f"{s.earnings():<10.2f}{s.percent_yield():<10.2f}{s.yearly_return():<10.2f}\n")
+            # Format every column at once and write the block in one call
+            lines = np.char.mod('S%-5d', np.arange(1, len(folio) + 1))
+            for fmt, col in (('%-10s', folio.symbols.astype(str)), ('%-6d', folio.qty),
+                             ('%-10.2f', earnings), ('%-10.2f', pct_yield), ('%-10.2f', yearly)):
+                lines = np.char.add(lines, np.char.mod(fmt, col))
+            if len(lines):
+                f.write('\n'.join(lines) + '\n')
             f.write("\nBONDS:\n")
             f.write(f"{'ID':<6}{'Symbol':<10}{'Qty':<6}{'Earn':<10}{'Date':<12}\n")
-            for b in bonds:
-                f.write(f"{b.purchase_id:<6}{b.symbol:<10}{b.quantity:<6}"
-                        f"{b.earnings():<10.2f}{b.purchase_date:<12}\n")
+            barr = _bond_array(bonds)
+            bond_earn = (barr['cp'] - barr['pp']) * barr['qty'] + barr['qty'] * barr['pp'] * barr['yld']
+            bdates = np.asarray(pd.to_datetime(barr['pdate']).strftime('%m/%d/%Y'))
+            blines = np.char.mod('%-6s', barr['pid'])
+            for fmt, col in (('%-10s', barr['symbol']), ('%-6d', barr['qty']),
+                             ('%-10.2f', bond_earn), ('%-12s', bdates)):
+                blines = np.char.add(blines, np.char.mod(fmt, col))
+            if len(blines):
+                f.write('\n'.join(blines) + '\n')
     except Exception as e:
         print(f"Failed to write report '{output_file}': {e}")
 
 # === CSV Export ===
-def export_csv(stocks, csv_file):
+def export_csv(folio, csv_file):
     try:
-        with open(csv_file, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['Symbol', 'Earnings', 'Yield%', 'Yearly%'])
-            for s in stocks:
-                writer.writerow([s.symbol, f"{s.earnings():.2f}", f"{s.percent_yield():.2f}", f"{s.yearly_return():.2f}"])
+        earnings, pct_yield, yearly = folio.metrics()
+        df = pd.DataFrame({
+            'Symbol': folio.symbols,
+            'Earnings': earnings,
+            'Yield%': pct_yield,
+            'Yearly%': yearly,
+        })
+        df.to_csv(csv_file, index=False, float_format='%.2f')
     except Exception as e:
         print(f"Failed to export CSV '{csv_file}': {e}")
 
 # === CLI Filtering Enhancement ===
 def interactive_portfolio_filter(stocks):
     def norm(ch): return ch.strip().lower().split()[0]
+    # Metrics never change during a session, so build each view once
+    # instead of rescanning the whole list per menu choice
+    by_sym = {s.symbol: s for s in stocks}
+    positive = [s for s in stocks if s.earnings() > 0]
+    negative = [s for s in stocks if s.earnings() < 0]
+    ranked = sorted(stocks, key=lambda x: x.yearly_return(), reverse=True)
     while True:
         print("\nFilter options: [1] positive, [2] negative, [3] sort, [4] lookup, [5] exit")
         choice = norm(input("Choice: "))
         if choice in ['1','positive']:
-            for s in stocks:
-                if s.earnings() > 0:
-                    print(f"{s.symbol}: ${s.earnings():,.2f}")
+            for s in positive:
+                print(f"{s.symbol}: ${s.earnings():,.2f}")
         elif choice in ['2','negative']:
-            for s in stocks:
-                if s.earnings() < 0:
-                    print(f"{s.symbol}: ${s.earnings():,.2f}")
+            for s in negative:
+                print(f"{s.symbol}: ${s.earnings():,.2f}")
         elif choice in ['3','sort']:
-            for s in sorted(stocks, key=lambda x: x.yearly_return(), reverse=True):
+            for s in ranked:
                 print(f"{s.symbol}: {s.yearly_return():.2f}%")
         elif choice in ['4','lookup']:
             sym = input("Enter symbol: ").upper()
-            found = [s for s in stocks if s.symbol == sym]
-            if found:
-                s = found[0]
+            s = by_sym.get(sym)
+            if s:
                 print(f"{s.symbol}: Earn={s.earnings():.2f}, Yearly%={s.yearly_return():.2f}")
             else:
                 print("Not found.")
@@ -202,27 +378,91 @@ def interactive_portfolio_filter(stocks):
             print("Invalid.")
 
 # === JSON Visualization ===
+# Month lookup for the history file's 'd-Mon-yy' dates; a table-driven
+# parse skips strptime's format-interpreter and locale machinery
+_MONTHS = {'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+           'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12}
+
+def _parse_history_date(s):
+    """Parse 'd-Mon-yy' to a datetime64 day; malformed values become NaT."""
+    try:
+        d, m, y = s.split('-')
+        # Same two-digit-year pivot as strptime's %y: 69-99 -> 19xx
+        yy = int(y)
+        year = 1900 + yy if yy >= 69 else 2000 + yy
+        return np.datetime64(f'{year:04d}-{_MONTHS[m]:02d}-{int(d):02d}')
+    except (AttributeError, KeyError, ValueError):
+        return np.datetime64('NaT')
+
+def _stream_history(f, portfolio):
+    """Stream history records with ijson, keeping only portfolio symbols.
+
+    Records for other symbols never reach the Python heap, so peak memory
+    scales with the portfolio rather than the file size. Kept rows land in
+    NumPy buffers grown by doubling.
+    """
+    cap = 1024
+    syms = np.empty(cap, object)
+    dates = np.empty(cap, 'datetime64[D]')
+    closes = np.empty(cap, np.float64)
+    n = 0
+    # Symbols repeat across records: intern them so the column holds one
+    # canonical string object per ticker instead of millions of copies
+    sym_cache = {}
+    for e in ijson.items(f, 'item'):
+        sym = e.get('Symbol')
+        if sym not in portfolio:
+            continue
+        sym = sym_cache.setdefault(sym, sys.intern(sym))
+        if n == cap:
+            cap *= 2
+            syms = np.resize(syms, cap)
+            dates = np.resize(dates, cap)
+            closes = np.resize(closes, cap)
+        syms[n] = sym
+        dates[n] = _parse_history_date(e.get('Date'))
+        try:
+            closes[n] = float(e.get('Close', 'nan'))
+        except (TypeError, ValueError):
+            closes[n] = np.nan
+        n += 1
+    return pd.DataFrame({'Symbol': syms[:n], 'Date': dates[:n], 'Close': closes[:n]})
+
 def visualize_json(json_file, portfolio):
+    # matplotlib takes ~200ms to import, so only pay for it when a chart
+    # is actually requested; the CLI-only paths start that much faster
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
     try:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        values = defaultdict(list)
-        for e in data:
-            sym = e.get('Symbol')
-            if sym in portfolio:
-                try:
-                    d = datetime.strptime(e['Date'], '%d-%b-%y')
-                    val = float(e['Close']) * portfolio[sym]
-                    values[sym].append((d, val))
-                except:
-                    continue
-        plt.figure(figsize=(10,6))
-        for sym, recs in values.items():
-            recs.sort(key=lambda x: x[0])
-            dates, vals = zip(*recs)
-            plt.plot(dates, vals, label=sym)
-        plt.legend(); plt.title("Portfolio Value Over Time")
-        plt.savefig("portfolio_history.png")
+        # Binary mode: ijson consumes bytes natively (text mode makes it
+        # re-encode every chunk), and json.load accepts binary files too
+        with open(json_file, 'rb') as f:
+            if ijson is not None:
+                # Streamed dates are already parsed to datetime64
+                df = _stream_history(f, portfolio)
+            else:
+                df = pd.DataFrame(json.load(f))
+                df = df[df['Symbol'].isin(portfolio)]
+                # One vectorized parse instead of strptime per record
+                df['Date'] = pd.to_datetime(df['Date'], format='%d-%b-%y', errors='coerce')
+                df['Close'] = pd.to_numeric(df['Close'], errors='coerce')
+        # Malformed dates or closes were coerced to NaT/NaN; drop them here
+        df = df.dropna(subset=['Date', 'Close'])
+        # Map quantities while Symbol is still plain strings: mapping a
+        # categorical can itself return a categorical, which breaks the multiply
+        df['Val'] = df['Close'] * df['Symbol'].map(portfolio)
+        # Category codes make the groupby below an integer operation
+        df['Symbol'] = df['Symbol'].astype('category')
+        df = df.sort_values('Date')
+        # Cheaper line simplification; rasterize very dense lines
+        plt.rcParams['path.simplify_threshold'] = 1.0
+        fig, ax = plt.subplots(figsize=(10, 6))
+        for sym, g in df.groupby('Symbol', sort=False, observed=True):
+            ax.plot(g['Date'], g['Val'], label=sym, rasterized=len(g) > 10_000)
+        ax.legend(); ax.set_title("Portfolio Value Over Time")
+        fig.savefig("portfolio_history.png")
+        plt.close(fig)
         print("Saved portfolio_history.png")
     except Exception as e:
         print(f"Visualization failed: {e}")
@@ -236,17 +476,19 @@ def main():
     json_file = "AllStocks.json"
 
     # Read files
-    stocks = read_stocks(stock_file)
+    folio = read_stocks(stock_file)
+    stocks = folio.to_investments()
     bonds = read_bonds(bond_file)
     # Hardcoded bond addition
     bonds.append(Bond("B999","GT2:GOV",200,100.02,100.05,1.38,"1.35%","8/1/2017"))
 
     # Database
     conn = setup_database(db_file, stocks, bonds)
-    # Fetch from DB if needed (not shown)
+    # Report from the database copy, never materializing row objects
+    folio = get_stocks(conn)
     # Reporting
-    write_report(investor, stocks, bonds, "Investment_Report.txt")
-    export_csv(stocks, "stock_summary.csv")
+    write_report(investor, folio, bonds, "Investment_Report.txt")
+    export_csv(folio, "stock_summary.csv")
 
     # CLI filter
     interactive_portfolio_filter(stocks)